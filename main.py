@@ -2,13 +2,22 @@ from fastapi import FastAPI
 
 app = FastAPI()
 
+_TEST_RESPONSE = {"message": "Hello, this is a test endpoint!"}
+
 
 @app.get("/test")
 async def test_endpoint() -> dict[str, str]:
-    return {"message": "Hello, this is a test endpoint!"}
+    return _TEST_RESPONSE
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=80)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=80,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )